@@ -9,12 +9,16 @@ import abc
 import re
 import numpy
 from copy import copy, deepcopy
+from functools import partial
+from itertools import chain
 from abc import ABC
 from typing import Optional, Generator, Tuple, List, Iterable
 
 
 def _array(value, shape=(-1,), dtype=numpy.float64):
-    # Ensure proper ordering(F) and alignment(A) for "C" access in integrators
+    # Ensure proper ordering(F) and alignment(A) for "C" access in integrators.
+    # The integrators index matrices in column-major order (A[i+6*j]), so
+    # the Fortran order must be kept
     return numpy.require(value, dtype=dtype, requirements=['F', 'A']).reshape(
         shape, order='F')
 
@@ -27,6 +31,20 @@ def _nop(value):
     return value
 
 
+_scalars = (int, float, str)
+_newline = re.compile(r'\n\s*')
+
+
+def _equal(v1, v2) -> bool:
+    # Plain scalars are compared directly, avoiding numpy.array_equal
+    if v2 is None:
+        # Attribute absent from the reference
+        return v1 is None
+    if isinstance(v1, _scalars) and isinstance(v2, _scalars):
+        return v1 == v2
+    return numpy.array_equal(v1, v2)
+
+
 class LongtMotion(ABC):
     """Abstract Base class for all Element classes whose instances may modify
     the particle momentum
@@ -240,16 +258,17 @@ class Element(object):
     _BUILD_ATTRIBUTES = ['FamName']
     _conversions = dict(FamName=str, PassMethod=str, Length=float,
                         R1=_array66, R2=_array66,
-                        T1=lambda v: _array(v, (6,)),
-                        T2=lambda v: _array(v, (6,)),
-                        RApertures=lambda v: _array(v, (4,)),
-                        EApertures=lambda v: _array(v, (2,)),
-                        KickAngle=lambda v: _array(v, (2,)),
+                        T1=partial(_array, shape=(6,)),
+                        T2=partial(_array, shape=(6,)),
+                        RApertures=partial(_array, shape=(4,)),
+                        EApertures=partial(_array, shape=(2,)),
+                        KickAngle=partial(_array, shape=(2,)),
                         PolynomB=_array, PolynomA=_array,
                         BendingAngle=float,
                         MaxOrder=int, NumIntSteps=int,
                         Energy=float,
                         )
+    _convert = _conversions.get
 
     _entrance_fields = ['T1', 'R1']
     _exit_fields = ['T2', 'R2']
@@ -268,10 +287,18 @@ class Element(object):
         self.PassMethod = kwargs.pop('PassMethod', 'IdentityPass')
         self.update(kwargs)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Bind the conversion lookup once per class
+        cls._convert = cls._conversions.get
+        # Register the element classes defined in this module
+        if cls.__module__ == __name__:
+            CLASS_MAP[cls.__name__] = cls
+
     def __setattr__(self, key, value):
         try:
-            super(Element, self).__setattr__(
-                key, self._conversions.get(key, _nop)(value))
+            # object.__setattr__ avoids building a super() proxy on each call
+            object.__setattr__(self, key, self._convert(key, _nop)(value))
         except Exception as exc:
             exc.args = ('In element {0}, parameter {1}: {2}'.format(
                 self.FamName, key, exc),)
@@ -291,8 +318,8 @@ class Element(object):
         defelem = self.__class__(*arguments)
         keywords = ['{0!r}'.format(arg) for arg in arguments]
         keywords += ['{0}={1!r}'.format(k, v) for k, v in sorted(attrs.items())
-                     if not numpy.array_equal(v, getattr(defelem, k, None))]
-        args = re.sub(r'\n\s*', ' ', ', '.join(keywords))
+                     if not _equal(v, getattr(defelem, k, None))]
+        args = _newline.sub(' ', ', '.join(keywords))
         return '{0}({1})'.format(self.__class__.__name__, args)
 
     def equals(self, other) -> bool:
@@ -301,6 +328,11 @@ class Element(object):
         This implementation was found to be too slow for the generic
         __eq__ method when comparing lattices.
         """
+        # The repr is not cached: array attributes may be modified in place
+        if self is other:
+            return True
+        if type(self).__name__ != type(other).__name__:
+            return False
         return repr(self) == repr(other)
 
     def divide(self, frac) -> List["Element"]:
@@ -361,6 +393,26 @@ class Element(object):
         for (key, value) in attrs.items():
             setattr(self, key, value)
 
+    def __copy__(self):
+        # Bypass the generic __reduce_ex__ protocol
+        cls = self.__class__
+        inst = cls.__new__(cls)
+        inst.__dict__.update(self.__dict__)
+        return inst
+
+    def __deepcopy__(self, memo):
+        # Numerical arrays are cloned directly, keeping their memory layout
+        cls = self.__class__
+        inst = cls.__new__(cls)
+        memo[id(self)] = inst
+        attrs = inst.__dict__
+        for k, v in self.__dict__.items():
+            if type(v) is numpy.ndarray and v.dtype != object:
+                attrs[k] = v.copy(order='K')
+            else:
+                attrs[k] = deepcopy(v, memo)
+        return inst
+
     def copy(self) -> "Element":
         """Return a shallow copy of the element"""
         return copy(self)
@@ -404,6 +456,9 @@ class Element(object):
         return self._get_collective()
 
 
+CLASS_MAP = dict(Element=Element)
+
+
 class LongElement(Element):
     """Base class for long elements
     """
@@ -443,7 +498,8 @@ class LongElement(Element):
         fout = dict(popattr(el, key) for key in vars(self) if
                     key in self._exit_fields)
         # Split element
-        element_list = [el._part(f, numpy.sum(frac)) for f in frac]
+        sumfr = numpy.sum(frac)
+        element_list = [el._part(f, sumfr) for f in frac]
         # Restore entrance and exit attributes
         for key, value in fin.items():
             setattr(element_list[0], key, value)
@@ -493,7 +549,8 @@ class BeamMoments(Element):
 class Aperture(Element):
     """Aperture element"""
     _BUILD_ATTRIBUTES = Element._BUILD_ATTRIBUTES + ['Limits']
-    _conversions = dict(Element._conversions, Limits=lambda v: _array(v, (4,)))
+    _conversions = dict(Element._conversions,
+                        Limits=partial(_array, shape=(4,)))
 
     def __init__(self, family_name, limits, **kwargs):
         """
@@ -557,14 +614,16 @@ class Drift(LongElement):
         lg = [0.0 if el is None else el.Length for el in elements]
         fr = numpy.asarray(frac, dtype=float)
         lg = 0.5 * numpy.asarray(lg, dtype=float) / self.Length
-        drfrac = numpy.hstack((fr - lg, 1.0)) - numpy.hstack((0.0, fr + lg))
+        nel = len(fr)
+        drfrac = numpy.empty(nel + 1)
+        drfrac[:nel] = fr - lg
+        drfrac[nel] = 1.0
+        drfrac[1:] -= fr + lg
         long_elems = (drfrac != 0.0)
         drifts = numpy.ndarray((len(drfrac),), dtype='O')
         drifts[long_elems] = self.divide(drfrac[long_elems])
-        nline = len(drifts) + len(elements)
-        line = [None] * nline  # type: List[Optional[Element]]
-        line[::2] = drifts
-        line[1::2] = elements
+        # Interleave drifts and elements, dropping the missing ones
+        line = chain.from_iterable(zip(drifts, elements + (None,)))
         return [el for el in line if el is not None]
 
 
@@ -606,12 +665,14 @@ class ThinMultipole(Element):
         """
 
         def getpol(poly):
-            nonzero = numpy.flatnonzero(poly != 0.0)
-            return poly, len(poly), nonzero[-1] if len(nonzero) > 0 else -1
-
-        def lengthen(poly, dl):
-            if dl > 0:
-                return numpy.concatenate((poly, numpy.zeros(dl)))
+            nonzero = numpy.flatnonzero(poly)
+            return poly, poly.size, nonzero[-1] if nonzero.size > 0 else -1
+
+        def lengthen(poly, length):
+            if length > poly.size:
+                newpoly = numpy.zeros(length)
+                newpoly[:poly.size] = poly
+                return newpoly
             else:
                 return poly
 
@@ -624,23 +685,25 @@ class ThinMultipole(Element):
         super(ThinMultipole, self).__init__(family_name, **kwargs)
         # Set MaxOrder while PolynomA and PolynomB are not set yet
         super(ThinMultipole, self).__setattr__('MaxOrder', maxorder)
-        # Adjust polynom lengths and set them
+        # Adjust polynom lengths and set them. They are consistent with
+        # MaxOrder by construction, so the checks are skipped
         len_ab = max(self.MaxOrder + 1, len_a, len_b)
-        self.PolynomA = lengthen(poly_a, len_ab - len_a)
-        self.PolynomB = lengthen(poly_b, len_ab - len_b)
+        super(ThinMultipole, self).__setattr__(
+            'PolynomA', lengthen(poly_a, len_ab))
+        super(ThinMultipole, self).__setattr__(
+            'PolynomB', lengthen(poly_b, len_ab))
 
     def __setattr__(self, key, value):
         """Check the compatibility of MaxOrder, PolynomA and PolynomB"""
-        polys = ('PolynomA', 'PolynomB')
-        if key in polys:
+        if key == 'PolynomA' or key == 'PolynomB':
             value = _array(value)
-            lmin = getattr(self, 'MaxOrder')
+            lmin = self.MaxOrder
             if not len(value) > lmin:
                 raise ValueError(
                     'Length of {0} must be larger than {1}'.format(key, lmin))
         elif key == 'MaxOrder':
             value = int(value)
-            lmax = min(len(getattr(self, k)) for k in polys)
+            lmax = min(len(self.PolynomA), len(self.PolynomB))
             if not value < lmax:
                 raise ValueError(
                     'MaxOrder must be smaller than {0}'.format(lmax))
@@ -679,12 +742,10 @@ class Multipole(_Radiative, LongElement, ThinMultipole):
     def is_compatible(self, other) -> bool:
         if super().is_compatible(other) and \
                 self.MaxOrder == other.MaxOrder:
-            for i in range(self.MaxOrder + 1):
-                if self.PolynomB[i] != other.PolynomB[i]:
-                    return False
-                if self.PolynomA[i] != other.PolynomA[i]:
-                    return False
-            return True
+            n = self.MaxOrder + 1
+            return (numpy.array_equal(self.PolynomB[:n], other.PolynomB[:n])
+                    and numpy.array_equal(self.PolynomA[:n],
+                                          other.PolynomA[:n]))
         else:
             return False
 
@@ -692,7 +753,8 @@ class Multipole(_Radiative, LongElement, ThinMultipole):
     @property
     def K(self) -> float:
         """Focusing strength [mˆ-2]"""
-        return 0.0 if len(self.PolynomB) < 2 else self.PolynomB[1]
+        pb = self.PolynomB
+        return 0.0 if pb.size < 2 else pb[1]
 
     # noinspection PyPep8Naming
     @K.setter
@@ -703,7 +765,8 @@ class Multipole(_Radiative, LongElement, ThinMultipole):
     @property
     def H(self) -> float:
         """Sextupolar strength"""
-        return 0.0 if len(self.PolynomB) < 3 else self.PolynomB[2]
+        pb = self.PolynomB
+        return 0.0 if pb.size < 3 else pb[2]
 
     # noinspection PyPep8Naming
     @H.setter
@@ -807,6 +870,7 @@ class Dipole(Radiative, Multipole):
 
 # Bend is a synonym of Dipole.
 Bend = Dipole
+CLASS_MAP['Bend'] = Bend
 
 
 class Quadrupole(Radiative, Multipole):
@@ -1003,8 +1067,8 @@ class Wiggler(Radiative, LongElement):
                                                          'Energy']
     _conversions = dict(Element._conversions, Lw=float, Bmax=float,
                         Energy=float,
-                        Bx=lambda v: _array(v, (6, -1)),
-                        By=lambda v: _array(v, (6, -1)),
+                        Bx=partial(_array, shape=(6, -1)),
+                        By=partial(_array, shape=(6, -1)),
                         Nstep=int, Nmeth=int, NHharm=int, NVharm=int)
 
     # noinspection PyPep8Naming
@@ -1038,17 +1102,19 @@ class Wiggler(Radiative, LongElement):
                                       Bmax=b_max, Nstep=Nstep, Nmeth=Nmeth,
                                       By=By, Bx=Bx, Energy=energy, **kwargs)
 
-        for i, b in enumerate(self.By.T):
-            dk = abs(b[3] ** 2 - b[4] ** 2 - b[2] ** 2) / abs(b[4])
-            if dk > 1e-6:
-                raise ValueError("Wiggler(H): kx^2 + kz^2 -ky^2 !=0, i = "
-                                 "{0}".format(i))
+        b = self.By
+        dk = numpy.abs(b[3] ** 2 - b[4] ** 2 - b[2] ** 2) / numpy.abs(b[4])
+        bad = numpy.flatnonzero(dk > 1e-6)
+        if bad.size > 0:
+            raise ValueError("Wiggler(H): kx^2 + kz^2 -ky^2 !=0, i = "
+                             "{0}".format(bad[0]))
 
-        for i, b in enumerate(self.Bx.T):
-            dk = abs(b[2] ** 2 - b[4] ** 2 - b[3] ** 2) / abs(b[4])
-            if dk > 1e-6:
-                raise ValueError("Wiggler(V): ky^2 + kz^2 -kx^2 !=0, i = "
-                                 "{0}".format(i))
+        b = self.Bx
+        dk = numpy.abs(b[2] ** 2 - b[4] ** 2 - b[3] ** 2) / numpy.abs(b[4])
+        bad = numpy.flatnonzero(dk > 1e-6)
+        if bad.size > 0:
+            raise ValueError("Wiggler(V): ky^2 + kz^2 -kx^2 !=0, i = "
+                             "{0}".format(bad[0]))
 
         self.NHharm = self.By.shape[1]
         self.NVharm = self.Bx.shape[1]
@@ -1090,8 +1156,3 @@ def build_class_map():  # Missing class aliases (Bend)
 def get_class_map():
     return CLASS_MAP
 
-
-# build_class_map()
-
-CLASS_MAP = dict((k, v) for k, v in locals().items()
-                 if isinstance(v, type) and issubclass(v, Element))
@@ -10,6 +10,8 @@ class Particle(object):
     Particle object: it defines the properties of the particles circulating
     in a ring
     """
+    # Slots for the fixed attributes, __dict__ for the optional keywords
+    __slots__ = ('name', '_rest_energy', '_charge', '__dict__')
     _known = dict(
         relativistic=dict(rest_energy=0.0, charge=-1.0),
         electron=dict(rest_energy=e_mass, charge=-1.0),
@@ -38,16 +40,24 @@ class Particle(object):
             kwargs.update(self._known[name])
         self.name = name
         # Use a numpy scalar to allow division by zero
-        self._rest_energy = numpy.array(kwargs.pop('rest_energy'), dtype=float)
+        self._rest_energy = numpy.float64(kwargs.pop('rest_energy'))
         self._charge = kwargs.pop('charge')
         for (key, val) in kwargs.items():
             setattr(self, key, val)
 
     def to_dict(self) -> Dict:
-        attrs = vars(self).copy()
-        attrs['rest_energy'] = attrs.pop('_rest_energy')
-        attrs['charge'] = attrs.pop('_charge')
-        return attrs
+        return dict(name=self.name, rest_energy=self._rest_energy,
+                    charge=self._charge, **vars(self))
+
+    def __getstate__(self):
+        # Keep the single-dictionary layout used before the slots, so that
+        # pickles stay compatible in both directions
+        return dict(vars(self), name=self.name,
+                    _rest_energy=self._rest_energy, _charge=self._charge)
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
 
     def __repr__(self):
         if self.name in self._known:
@@ -67,7 +77,7 @@ class Particle(object):
 
     # Use properties so that they are read-only
     @property
-    def rest_energy(self) -> numpy.ndarray:
+    def rest_energy(self) -> numpy.float64:
         """Particle rest energy [eV]"""
         return self._rest_energy
 
@@ -6,7 +6,6 @@ import sys
 from os.path import abspath, basename, splitext
 from warnings import warn
 from typing import Optional, Generator, Sequence
-import scipy.io
 import numpy
 from ..lattice import elements, AtWarning, params_filter, AtError
 from ..lattice import Element, Lattice
@@ -49,35 +48,36 @@ def matfile_generator(params: dict, mat_file: str)\
         elem (Element): new Elements
     """
     def mclean(data):
-        if data.dtype.type is numpy.str_:
-            # Convert strings in arrays back to strings.
-            return str(data[0]) if data.size > 0 else ''
-        elif data.size == 1:
-            v = data[0, 0]
-            if issubclass(v.dtype.type, numpy.void):
+        if isinstance(data, numpy.ndarray):
+            if data.dtype.kind == 'U':
+                # Convert strings in arrays back to strings.
+                return data.item(0) if data.size > 0 else ''
+            elif data.dtype.names is not None and data.ndim == 0:
                 # Object => Return a dict
-                return {f: mclean(v[f]) for f in v.dtype.fields}
-            else:
-                # Return a scalar
-                return v
-        else:
-            # Remove any surplus dimensions in arrays.
-            return numpy.squeeze(data)
+                return dict(zip(data.dtype.names, map(mclean, data.item())))
+        # Scalars and arrays are already squeezed by loadmat
+        return data
 
-    m = scipy.io.loadmat(params.setdefault('mat_file', mat_file))
-    matvars = [varname for varname in m if not varname.startswith('__')]
+    from scipy.io import loadmat, whosmat
+
+    mat_file = params.setdefault('mat_file', mat_file)
+    # List the variables without reading their contents
+    matvars = [varname for varname, _, _ in whosmat(mat_file)]
     default_key = matvars[0] if (len(matvars) == 1) else 'RING'
     key = params.setdefault('mat_key', default_key)
-    if key not in m.keys():
-        kok = [k for k in m.keys() if '__' not in k]
+    if key not in matvars:
         raise AtError('Selected mat_key does not exist, '
-                      'please select in: {}'.format(kok))
+                      'please select in: {}'.format(matvars))
+    # Decode only the selected variable
+    m = loadmat(mat_file, variable_names=[key], squeeze_me=True)
     check = params.pop('check', True)
     quiet = params.pop('quiet', False)
-    cell_array = m[key].flat
+    # A single-element cell array is squeezed down to its struct
+    cell_array = m[key].reshape(-1)
     for index, mat_elem in enumerate(cell_array):
-        elem = mat_elem[0, 0]
-        kwargs = {f: mclean(elem[f]) for f in elem.dtype.fields}
+        # item() extracts all the struct fields in a single call
+        kwargs = dict(zip(mat_elem.dtype.names,
+                          map(mclean, mat_elem.item())))
         yield element_from_dict(kwargs, index=index, check=check, quiet=quiet)
 
 
@@ -281,8 +281,10 @@ def save_mat(ring: Lattice, filename: str,
     See Also:
         :py:func:`.save_lattice` for a generic lattice-saving function.
     """
+    from scipy.io import savemat
+
     lring = tuple((element_to_dict(elem),) for elem in matlab_ring(ring))
-    scipy.io.savemat(filename, {mat_key: lring}, long_field_names=True)
+    savemat(filename, {mat_key: lring}, long_field_names=True)
 
 
 def save_m(ring: Lattice, filename: Optional[str] = None) -> None:
@@ -2,6 +2,7 @@
 Conversion utilities for creating pyat elements
 """
 import collections
+import functools
 import os
 import re
 import numpy
@@ -17,6 +18,8 @@ from at.lattice import Particle, Element
 from numpy import array, uint8  # For global namespace
 
 _ext_suffix = sysconfig.get_config_var('EXT_SUFFIX')
+# File names of the integrators already found
+_found_integrators = set()
 
 
 def _particle(value):
@@ -61,6 +64,15 @@ _alias_map = {'rbend': elt.Dipole,
 # Matlab to Python class translation
 _CLASS_MAP = dict((k.lower(), v) for k, v in CLASS_MAP.items())
 _CLASS_MAP.update(_alias_map)
+# Same map also accepting the exact class names, to avoid lowercasing
+_SPELLING_MAP = dict(_CLASS_MAP, RingParam=RingParam, **CLASS_MAP)
+
+
+def _class_lookup(name: str):
+    """Class matching a name, trying the exact spelling first"""
+    cls = _SPELLING_MAP.get(name)
+    return _CLASS_MAP.get(name.lower()) if cls is None else cls
+
 
 _PASS_MAP = {'BendLinearPass': elt.Dipole,
              'BndMPoleSymplectic4RadPass': elt.Dipole,
@@ -105,10 +117,35 @@ def hasattrs(kwargs: dict, *attributes) -> bool:
         found (bool):   :py:obj:`True` if the element has any of the specified
           attributes.
     """
-    for attribute in attributes:
-        if attribute in kwargs:
-            return True
-    return False
+    return not kwargs.keys().isdisjoint(attributes)
+
+
+# Attribute signatures identifying element classes, in order of priority.
+# The Multipole entry stands for the whole multipole family, resolved from
+# the PolynomB values.
+_class_signatures = (
+    (frozenset(('FullGap', 'FringeInt1', 'FringeInt2', 'gK',
+                'EntranceAngle', 'ExitAngle')), elt.Dipole),
+    (frozenset(('Voltage', 'Frequency', 'HarmNumber', 'PhaseLag',
+                'TimeLag')), elt.RFCavity),
+    (frozenset(('Periodicity',)), RingParam),
+    (frozenset(('Limits',)), elt.Aperture),
+    (frozenset(('M66',)), elt.M66),
+    (frozenset(('K',)), elt.Quadrupole),
+    (frozenset(('PolynomB', 'PolynomA')), elt.Multipole),
+    (frozenset(('KickAngle',)), elt.Corrector),
+)
+
+
+# A lattice has a few tens of distinct attribute sets: the bound only
+# limits the growth when many lattices are loaded in the same process
+@functools.lru_cache(maxsize=256)
+def _class_from_signature(keys: frozenset) -> Optional[type(Element)]:
+    """Class matching a set of attribute names, memoised per set"""
+    for signature, cls in _class_signatures:
+        if not keys.isdisjoint(signature):
+            return cls
+    return None
 
 
 def find_class(elem_dict: dict, quiet: bool = False) -> type(Element):
@@ -124,24 +161,23 @@ def find_class(elem_dict: dict, quiet: bool = False) -> type(Element):
     """
 
     def low_order(key):
-        polynom = numpy.array(elem_dict[key], dtype=numpy.float64).reshape(-1)
-        try:
-            low = numpy.where(polynom != 0.0)[0][0]
-        except IndexError:
-            low = -1
-        return low
+        polynom = numpy.asarray(elem_dict[key], dtype=numpy.float64)
+        nonzero = numpy.flatnonzero(polynom)
+        return nonzero[0] if nonzero.size > 0 else -1
 
     class_name = elem_dict.pop('Class', '')
-    try:
-        return _CLASS_MAP[class_name.lower()]
-    except KeyError:
+    cls = _class_lookup(class_name)
+    if cls is not None:
+        return cls
+    else:
         if not quiet and class_name:
             warn(AtWarning("Class '{0}' does not exist.\n"
                            "{1}".format(class_name, elem_dict)))
         fam_name = elem_dict.get('FamName', '')
-        try:
-            return _CLASS_MAP[fam_name.lower()]
-        except KeyError:
+        cls = _class_lookup(fam_name)
+        if cls is not None:
+            return cls
+        else:
             pass_method = elem_dict.get('PassMethod', '')
             if not quiet and not pass_method:
                 warn(AtWarning("No PassMethod provided."
@@ -155,22 +191,8 @@ def find_class(elem_dict: dict, quiet: bool = False) -> type(Element):
                 return class_from_pass
             else:
                 length = float(elem_dict.get('Length', 0.0))
-                if hasattrs(elem_dict, 'FullGap', 'FringeInt1', 'FringeInt2',
-                            'gK', 'EntranceAngle', 'ExitAngle'):
-                    return elt.Dipole
-                elif hasattrs(elem_dict, 'Voltage', 'Frequency', 'HarmNumber',
-                              'PhaseLag', 'TimeLag'):
-                    return elt.RFCavity
-                elif hasattrs(elem_dict, 'Periodicity'):
-                    # noinspection PyProtectedMember
-                    return RingParam
-                elif hasattrs(elem_dict, 'Limits'):
-                    return elt.Aperture
-                elif hasattrs(elem_dict, 'M66'):
-                    return elt.M66
-                elif hasattrs(elem_dict, 'K'):
-                    return elt.Quadrupole
-                elif hasattrs(elem_dict, 'PolynomB', 'PolynomA'):
+                cls = _class_from_signature(frozenset(elem_dict))
+                if cls is elt.Multipole:
                     loworder = low_order('PolynomB')
                     if loworder == 1:
                         return elt.Quadrupole
@@ -183,8 +205,8 @@ def find_class(elem_dict: dict, quiet: bool = False) -> type(Element):
                         return elt.Multipole
                     else:
                         return elt.ThinMultipole
-                elif hasattrs(elem_dict, 'KickAngle'):
-                    return elt.Corrector
+                elif cls is not None:
+                    return cls
                 elif length > 0.0:
                     return elt.Drift
                 elif hasattrs(elem_dict, 'GCR'):
@@ -195,6 +217,63 @@ def find_class(elem_dict: dict, quiet: bool = False) -> type(Element):
                     return elt.Element
 
 
+def _integrator_exists(file_name: str) -> bool:
+    """Check the presence of an integrator. Only the integrators found are
+    remembered, so that a missing one is looked for again on the next call
+    """
+    if file_name in _found_integrators:
+        return True
+    file_path = os.path.join(integrators.__path__[0], file_name)
+    exists = os.path.isfile(os.path.realpath(file_path))
+    if exists:
+        _found_integrators.add(file_name)
+    return exists
+
+
+def _sanitise_class(index: Optional[int], cls: type(Element),
+                    elem_dict: dict) -> None:
+    """Checks that the Class and PassMethod of the element are a valid
+        combination. Some Classes and PassMethods are incompatible and
+        would raise errors during calculation if left, so we raise an error
+        here with a more helpful message.
+
+    Args:
+        index:          element index
+        cls:            Proposed class
+        elem_dict:      The dictionary of keyword arguments passed to the
+                        Element constructor.
+
+    Raises:
+        AttributeError: if the PassMethod and Class are incompatible.
+    """
+    def err(message, *args):
+        location = ': ' if index is None else ' {0}: '.format(index)
+        msg = ''.join(('Error in element', location,
+                       'PassMethod {0} '.format(pass_method),
+                       message.format(*args), '\n{0}'.format(elem_dict)))
+        return AttributeError(msg)
+
+    class_name = cls.__name__
+    pass_method = elem_dict.get('PassMethod')
+    if pass_method is not None:
+        pass_to_class = _PASS_MAP.get(pass_method)
+        length = float(elem_dict.get('Length', 0.0))
+        file_name = pass_method + _ext_suffix
+        if not _integrator_exists(file_name):
+            raise err("does not have a {0} file.".format(file_name))
+        elif (pass_method == 'IdentityPass') and (length != 0.0):
+            raise err("is not compatible with length {0}.", length)
+        elif pass_to_class is not None:
+            if not issubclass(cls, pass_to_class):
+                raise err("is not compatible with Class {0}.", class_name)
+        elif issubclass(cls, (elt.Marker, elt.Monitor, RingParam)):
+            if pass_method != 'IdentityPass':
+                raise err("is not compatible with Class {0}.", class_name)
+        elif cls is elt.Drift:
+            if pass_method != 'DriftPass':
+                raise err("is not compatible with Class {0}.", class_name)
+
+
 def element_from_dict(elem_dict: dict, index: Optional[int] = None,
                       check: bool = True, quiet: bool = False) -> Element:
     """Builds an :py:class:`.Element` from a dictionary of attributes
@@ -208,54 +287,9 @@ def element_from_dict(elem_dict: dict, index: Optional[int] = None,
     Returns:
         elem (Element): new :py:class:`.Element`
     """
-
-    # noinspection PyShadowingNames
-    def sanitise_class(index, cls, elem_dict):
-        """Checks that the Class and PassMethod of the element are a valid
-            combination. Some Classes and PassMethods are incompatible and
-            would raise errors during calculation if left, so we raise an error
-            here with a more helpful message.
-
-        Args:
-            index:          element index
-            cls:            Proposed class
-            elem_dict:      The dictionary of keyword arguments passed to the
-                            Element constructor.
-
-        Raises:
-            AttributeError: if the PassMethod and Class are incompatible.
-        """
-        def err(message, *args):
-            location = ': ' if index is None else ' {0}: '.format(index)
-            msg = ''.join(('Error in element', location,
-                           'PassMethod {0} '.format(pass_method),
-                           message.format(*args), '\n{0}'.format(elem_dict)))
-            return AttributeError(msg)
-
-        class_name = cls.__name__
-        pass_method = elem_dict.get('PassMethod')
-        if pass_method is not None:
-            pass_to_class = _PASS_MAP.get(pass_method)
-            length = float(elem_dict.get('Length', 0.0))
-            file_name = pass_method + _ext_suffix
-            file_path = os.path.join(integrators.__path__[0], file_name)
-            if not os.path.isfile(os.path.realpath(file_path)):
-                raise err("does not have a {0} file.".format(file_name))
-            elif (pass_method == 'IdentityPass') and (length != 0.0):
-                raise err("is not compatible with length {0}.", length)
-            elif pass_to_class is not None:
-                if not issubclass(cls, pass_to_class):
-                    raise err("is not compatible with Class {0}.", class_name)
-            elif issubclass(cls, (elt.Marker, elt.Monitor, RingParam)):
-                if pass_method != 'IdentityPass':
-                    raise err("is not compatible with Class {0}.", class_name)
-            elif cls == elt.Drift:
-                if pass_method != 'DriftPass':
-                    raise err("is not compatible with Class {0}.", class_name)
-
     cls = find_class(elem_dict, quiet=quiet)
     if check:
-        sanitise_class(index, cls, elem_dict)
+        _sanitise_class(index, cls, elem_dict)
     # Remove mandatory attributes from the keyword arguments.
     # Create list rather than generator to ensure that elements are removed
     # from elem_dict.
@@ -8,7 +8,8 @@ from collections.abc import Callable
 import warnings
 from scipy.linalg import solve
 from ..constants import clight
-from ..lattice import DConstant, Refpts, get_bool_index, get_uint32_index
+from ..lattice import All, DConstant, Refpts, get_bool_index
+from ..lattice import get_uint32_index
 from ..lattice import AtWarning, Lattice, Orbit, check_6d, get_s_pos
 from ..lattice import frequency_control
 from ..tracking import lattice_pass
@@ -20,8 +21,7 @@ from .harmonic_analysis import get_tunes_harmonic
 __all__ = ['linopt', 'linopt2', 'linopt4', 'linopt6', 'avlinopt',
            'get_optics', 'get_tune', 'get_chrom']
 
-_S = jmat(1)
-_S2 = numpy.array([[0, 1], [-1, 0]], dtype=numpy.float64)
+_TWOPI = 2.0 * pi
 
 # dtype for structured array containing linopt parameters
 _DATA2_DTYPE = [('alpha', numpy.float64, (2,)),
@@ -59,12 +59,16 @@ _IDX_DTYPE = [('idx', numpy.uint32)]
 
 
 def _twiss22(t12, alpha0, beta0):
-    """Propagate Twiss parameters"""
-    bbb = t12[:, 0, 1]
-    aaa = t12[:, 0, 0] * beta0 - bbb * alpha0
+    """Propagate Twiss parameters
+
+    t12 is a stack of (..., 2, 2) matrices, alpha0 and beta0 broadcast on the
+    leading dimensions, so that both planes may be processed at once
+    """
+    bbb = t12[..., 0, 1]
+    aaa = t12[..., 0, 0] * beta0 - bbb * alpha0
     beta = (aaa * aaa + bbb * bbb) / beta0
-    alpha = -(aaa * (t12[:, 1, 0] * beta0 - t12[:, 1, 1] * alpha0) +
-              bbb * t12[:, 1, 1]) / beta0
+    alpha = -(aaa * (t12[..., 1, 0] * beta0 - t12[..., 1, 1] * alpha0) +
+              bbb * t12[..., 1, 1]) / beta0
     mu = numpy.arctan2(bbb, aaa)
     # Unwrap negative jumps in betatron phase advance
     # dmu = numpy.diff(numpy.append([0], mu))
@@ -73,16 +77,45 @@ def _twiss22(t12, alpha0, beta0):
     return alpha, beta, mu
 
 
+def _adj2(x):
+    """Adjugate of 2x2 matrices, equal to S @ x.T @ S.T with S = jmat(1)"""
+    y = numpy.empty_like(x)
+    y[..., 0, 0] = x[..., 1, 1]
+    y[..., 0, 1] = -x[..., 0, 1]
+    y[..., 1, 0] = -x[..., 1, 0]
+    y[..., 1, 1] = x[..., 0, 0]
+    return y
+
+
+def _det2(x):
+    """Determinant of 2x2 matrices"""
+    return x[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * x[..., 1, 0]
+
+
 def _closure(m22):
-    diff = (m22[0, 0] - m22[1, 1]) / 2.0
-    try:
-        sinmu = numpy.sign(m22[0, 1]) * sqrt(-m22[0, 1]*m22[1, 0] - diff*diff)
-        cosmu = 0.5 * numpy.trace(m22)
-        alpha = diff / sinmu
-        beta = m22[0, 1] / sinmu
-        return alpha, beta, cosmu + sinmu*1j
-    except ValueError:          # Unstable motion
-        return numpy.NaN, numpy.NaN, numpy.NaN
+    """Twiss parameters and eigenvalue of a stack of 2x2 matrices"""
+    diff = (m22[..., 0, 0] - m22[..., 1, 1]) / 2.0
+    with numpy.errstate(invalid='ignore'):  # Unstable motion gives NaN
+        sinmu = numpy.sign(m22[..., 0, 1]) * \
+            numpy.sqrt(-m22[..., 0, 1]*m22[..., 1, 0] - diff*diff)
+    cosmu = 0.5 * (m22[..., 0, 0] + m22[..., 1, 1])
+    alpha = diff / sinmu
+    beta = m22[..., 0, 1] / sinmu
+    return alpha, beta, cosmu + sinmu*1j
+
+
+def _unwrap(mu):
+    """Remove the phase jumps"""
+    jumps = numpy.empty(mu.shape, dtype=bool)
+    numpy.less(mu[:1], -1.e-3, out=jumps[:1])
+    numpy.less(mu[1:] - mu[:-1], -1.e-3, out=jumps[1:])
+    # The number of turns is small: no need for 64-bit counters
+    mu += numpy.cumsum(jumps, axis=0, dtype=numpy.int32) * _TWOPI
+
+
+def _fractunes(vps):
+    """Fractional tunes from the eigenvalues of the 1-turn matrix"""
+    return numpy.mod(numpy.angle(vps) / _TWOPI, 1.0)
 
 
 # noinspection PyShadowingNames,PyPep8Naming
@@ -93,50 +126,52 @@ def _tunes(ring, **kwargs):
     else:
         mt, _ = find_m44(ring, **kwargs)
     _, vps = a_matrix(mt)
-    tunes = numpy.mod(numpy.angle(vps) / 2.0 / pi, 1.0)
-    return tunes
+    return _fractunes(vps)
 
 
 def _analyze2(mt, ms):
     """Analysis of a 2D 1-turn transfer matrix"""
     A = mt[:2, :2]
     B = mt[2:, 2:]
-    alp0_a, bet0_a, vp_a = _closure(A)
-    alp0_b, bet0_b, vp_b = _closure(B)
-    vps = numpy.array([vp_a, vp_b])
-    el0 = (numpy.array([alp0_a, alp0_b]),
-           numpy.array([bet0_a, bet0_b]),
-           0.0)
-    alpha_a, beta_a, mu_a = _twiss22(ms[:, :2, :2], alp0_a, bet0_a)
-    alpha_b, beta_b, mu_b = _twiss22(ms[:, 2:, 2:], alp0_b, bet0_b)
-    els = (numpy.stack((alpha_a, alpha_b), axis=1),
-           numpy.stack((beta_a, beta_b), axis=1),
-           numpy.stack((mu_a, mu_b), axis=1))
+    alp0, bet0, vps = _closure(numpy.stack((A, B)))
+    el0 = (alp0, bet0, 0.0)
+    # Diagonal blocks of the transfer matrices: (nrefs, plane, 2, 2)
+    blocks = numpy.stack((ms[:, :2, :2], ms[:, 2:, 2:]), axis=1)
+    els = _twiss22(blocks, *el0[:2])
     return vps, _DATA2_DTYPE, el0, els
 
 
 def _analyze4(mt, ms):
     """Analysis of a 4D 1-turn transfer matrix according to Sagan, Rubin"""
     def propagate(t12):
-        M = t12[:2, :2]
-        N = t12[2:, 2:]
-        m = t12[:2, 2:]
-        n = t12[2:, :2]
+        # Vectorized over all the refpts: t12 has shape (nrefs, 4, 4)
+        M = t12[:, :2, :2]
+        N = t12[:, 2:, 2:]
+        m = t12[:, :2, 2:]
+        n = t12[:, 2:, :2]
+        # Normal-mode matrices of both planes: (nrefs, plane, 2, 2)
+        ef = numpy.empty((t12.shape[0], 2, 2, 2))
+        e12 = ef[:, 0]
+        f12 = ef[:, 1]
         ff = n @ C + g * N
-        gamma = sqrt(numpy.linalg.det(ff))
-        e12 = (g * M - m @ _S @ C.T @ _S.T) / gamma
-        f12 = ff / gamma
-        a12 = e12 @ A @ _S @ e12.T @ _S.T
-        b12 = f12 @ B @ _S @ f12.T @ _S.T
-        c12 = M @ C + g * m @ _S @ f12.T @ _S.T
-        return e12, f12, gamma, a12, b12, c12
+        detf = _det2(ff)
+        if numpy.any(detf < 0.0):
+            # Same error as the scalar math.sqrt of the unvectorized code
+            raise ValueError('math domain error')
+        gamma = numpy.sqrt(detf)
+        numpy.divide(g * M - m @ _adj2(C), gamma[:, None, None], out=e12)
+        numpy.divide(ff, gamma[:, None, None], out=f12)
+        a12 = e12 @ A @ _adj2(e12)
+        b12 = f12 @ B @ _adj2(f12)
+        c12 = M @ C + g * m @ _adj2(f12)
+        return ef, gamma, a12, b12, c12
 
     M = mt[:2, :2]
     N = mt[2:, 2:]
     m = mt[:2, 2:]
     n = mt[2:, :2]
-    H = m + _S @ n.T @ _S.T
-    detH = numpy.linalg.det(H)
+    H = m + _adj2(n)
+    detH = _det2(H)
     if detH == 0.0:
         g = 1.0
         C = -H
@@ -149,30 +184,13 @@ def _analyze4(mt, ms):
         g2 = (1.0 + sqrt(t2 / t2h)) / 2
         g = sqrt(g2)
         C = -H * numpy.sign(t) / (g * sqrt(t2h))
-        A = g2 * M - g * (m @ _S @ C.T @ _S.T + C @ n) + \
-            C @ N @ _S @ C.T @ _S.T
-        B = g2 * N + g * (_S @ C.T @ _S.T @ m + n @ C) + \
-            _S @ C.T @ _S.T @ M @ C
-    alp0_a, bet0_a, vp_a = _closure(A)
-    alp0_b, bet0_b, vp_b = _closure(B)
-    vps = numpy.array([vp_a, vp_b])
-    el0 = (numpy.array([alp0_a, alp0_b]),
-           numpy.array([bet0_a, bet0_b]),
-           0.0, g, A, B, C)
-    if ms.shape[0] > 0:
-        e, f, g, ai, bi, ci = zip(*[propagate(mi) for mi in ms])
-        alp_a, bet_a, mu_a = _twiss22(numpy.array(e), alp0_a, bet0_a)
-        alp_b, bet_b, mu_b = _twiss22(numpy.array(f), alp0_b, bet0_b)
-        els = (numpy.stack((alp_a, alp_b), axis=1),
-               numpy.stack((bet_a, bet_b), axis=1),
-               numpy.stack((mu_a, mu_b), axis=1), numpy.array(g),
-               numpy.stack(ai, axis=0), numpy.stack(bi, axis=0),
-               numpy.stack(ci, axis=0))
-    else:
-        els = (numpy.empty((0, 2)), numpy.empty((0, 2)),
-               numpy.empty((0, 2)), numpy.empty((0,)),
-               numpy.empty((0, 2, 2)), numpy.empty((0, 2, 2)),
-               numpy.empty((0, 2, 2)))
+        adjc = _adj2(C)
+        A = g2 * M - g * (m @ adjc + C @ n) + C @ N @ adjc
+        B = g2 * N + g * (adjc @ m + n @ C) + adjc @ M @ C
+    alp0, bet0, vps = _closure(numpy.stack((A, B)))
+    el0 = (alp0, bet0, 0.0, g, A, B, C)
+    ef, gi, ai, bi, ci = propagate(ms)
+    els = _twiss22(ef, *el0[:2]) + (gi, ai, bi, ci)
     return vps, _DATA4_DTYPE, el0, els
 
 
@@ -199,7 +217,7 @@ def _analyze6(mt, ms):
             return ai[:, slc] @ tt[slc, slc]
 
         ais = numpy.concatenate([mul2(slc) for slc in slices], axis=1)
-        invai = solve(ai, ss.T)
+        invai = solve(ai, ss.T, check_finite=False)
         ri = numpy.array(
             [ais[:, sl] @ invai[sl, :] for sl in slices])
         mui = numpy.array([get_phase(ai[sl, sl]) for sl in slices])
@@ -265,12 +283,14 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
             if twin['R'].shape[0] >= 3:
                 sigm = sigm+0.1*twin['R'][2, ...]
         except (ValueError, KeyError):  # record arrays throw ValueError !
-            slices = [slice(2 * i, 2 * (i + 1)) for i in range(2)]
-            ab = numpy.stack((twin['alpha'], twin['beta']), axis=1)
+            alpha = numpy.asarray(twin['alpha'])
+            beta = numpy.asarray(twin['beta'])
+            # Fill the 2x2 diagonal blocks of both planes at once
             sigm = numpy.zeros((4, 4))
-            for slc, (alpha, beta) in zip(slices, ab):
-                gamma = (1.0+alpha*alpha)/beta
-                sigm[slc, slc] = numpy.array([[beta, -alpha], [-alpha, gamma]])
+            sigm[[0, 2], [0, 2]] = beta
+            sigm[[0, 2], [1, 3]] = -alpha
+            sigm[[1, 3], [0, 2]] = -alpha
+            sigm[[1, 3], [1, 3]] = (1.0+alpha*alpha)/beta
         try:
             d0 = twin['dispersion']
         except (ValueError, KeyError):  # record arrays throw ValueError !
@@ -283,7 +303,7 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
         def off_momentum(rng, orb0):
             mt, ms = get_matrix(rng, refpts=refpts, orbit=orb0, **kwargs)
             vps, _, el0, els = analyze(mt, ms)
-            tunes = numpy.mod(numpy.angle(vps)/2.0/pi, 1.0)
+            tunes = _fractunes(vps)
             return tunes, el0, els
 
         def wget(ddp, elup, eldn):
@@ -306,13 +326,6 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
         ws = wget(deltap, elsup, elsdn)
         return chrom, w0, ws
 
-    def unwrap(mu):
-        """Remove the phase jumps"""
-        dmu = numpy.diff(numpy.concatenate((numpy.zeros((1, dms)),
-                                            mu)), axis=0)
-        jumps = dmu < -1.e-3
-        mu += numpy.cumsum(jumps, axis=0) * 2.0 * numpy.pi
-
     dp_step = kwargs.get('DPStep', DConstant.DPStep)
     addtype = kwargs.pop('addtype', [])
 
@@ -350,14 +363,16 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
     # Perform analysis
     vps, dtype, el0, els = analyze(mxx, ms)
     if twiss_in is None:
-        tunes = numpy.mod(numpy.angle(vps) / 2.0 / pi, 1.0)
+        tunes = _fractunes(vps)
     else:
         tunes = numpy.NaN
 
     # Propagate the closed orbit
     orb0, orbs = get_orbit(ring, refpts=refpts, orbit=orbit,
                            keep_lattice=keep_lattice)
-    spos = ring.get_s_pos(refpts)
+    # Positions of all the elements, computed once
+    s_all = get_s_pos(ring, All)
+    spos = s_all[get_bool_index(ring, refpts)]
 
     nrefs = orbs.shape[0]
     dms = vps.size
@@ -387,8 +402,9 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
                 chrom = (tunesup - tunesdn) / deltap
         else:
             chrom = numpy.NaN
-        length = ring.get_s_pos(len(ring))[0]
-        damping_rates = -numpy.log(numpy.absolute(vps))
+        length = s_all[-1]
+        # -log(|vps|) without the square root of the modulus
+        damping_rates = -0.5 * numpy.log(vps.real*vps.real + vps.imag*vps.imag)
         damping_times = length / clight / damping_rates
         beamdata = numpy.array((tunes, chrom, damping_times),
                                dtype=[('tune', numpy.float64, (dms,)),
@@ -404,12 +420,12 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
         o0dn, odn = get_orbit(ring, refpts=refpts, guess=orb0, dp=dpdn,
                               orbit=o0dn, **kwargs)
         d0 = (o0up - o0dn)[:4] / dp_step
-        ds = numpy.array([(up - dn)[:4] / dp_step for up, dn in zip(oup, odn)])
+        ds = (oup[:, :4] - odn[:, :4]) / dp_step
         dtype = dtype + [('dispersion', numpy.float64, (4,)),
                          ('closed_orbit', numpy.float64, (6,)),
                          (mname, numpy.float64, (2*dms, 2*dms)),
                          ('s_pos', numpy.float64)]
-        data0 = (d0, orb0, mt, get_s_pos(ring, len(ring)))
+        data0 = (d0, orb0, mt, s_all[-1])
         datas = (ds, orbs, ms, spos)
         if get_w:
             dtype = dtype + _W_DTYPE
@@ -433,7 +449,7 @@ def _linopt(ring: Lattice, analyze, refpts=None, dp=None, dct=None, df=None,
     if nrefs > 0:
         for name, value in zip(numpy.dtype(dtype).names, els+datas+adds):
             elemdata[name] = value
-        unwrap(elemdata.mu)
+        _unwrap(elemdata.mu)
     return elemdata0, beamdata, elemdata
 
 
@@ -1002,11 +1018,9 @@ def avlinopt(ring: Lattice, dp: float = None, refpts: Refpts = None, **kwargs):
         :py:func:`linopt4`, :py:func:`get_optics`
     """
     def get_strength(elem):
-        try:
-            k = elem.PolynomB[1]
-        except (AttributeError, IndexError):
-            k = 0.0
-        return k
+        # Drifts and markers have no PolynomB: avoid raising exceptions
+        pb = getattr(elem, 'PolynomB', ())
+        return pb[1] if len(pb) > 1 else 0.0
 
     def betadrift(beta0, beta1, alpha0, lg):
         gamma0 = (alpha0 * alpha0 + 1) / beta0
@@ -1020,14 +1034,18 @@ def avlinopt(ring: Lattice, dp: float = None, refpts: Refpts = None, **kwargs):
         return (dispp0 - dispp1) / k2 / lg
 
     boolrefs = get_bool_index(ring, refpts)
-    length = numpy.array([el.Length for el in ring[boolrefs]])
-    strength = numpy.array([get_strength(el) for el in ring[boolrefs]])
+    # Iterate once over the selected elements, without building a Lattice
+    elems = list(ring.select(boolrefs))
+    length = numpy.array([el.Length for el in elems])
     longelem = get_bool_index(ring, None)
     longelem[boolrefs] = (length != 0)
 
     shorti_refpts = (~longelem) & boolrefs
     longi_refpts = longelem & boolrefs
-    longf_refpts = numpy.roll(longi_refpts, 1)
+    # Exit of the long elements: entrance shifted by one
+    longf_refpts = numpy.empty_like(longi_refpts)
+    longf_refpts[1:] = longi_refpts[:-1]
+    longf_refpts[0] = longi_refpts[-1]
 
     all_refs = shorti_refpts | longi_refpts | longf_refpts
     _, bd, d_all = linopt4(ring, refpts=all_refs, dp=dp,
@@ -1039,10 +1057,15 @@ def avlinopt(ring: Lattice, dp: float = None, refpts: Refpts = None, **kwargs):
     avedisp = lindata.dispersion.copy()
     aves = lindata.s_pos.copy()
 
+    long = (length != 0.0)
+    if not numpy.any(long):
+        # Thin elements only: the averages are the local values
+        return lindata, avebeta, avemu, avedisp, aves, bd.tune, bd.chromaticity
+
+    strength = numpy.array([get_strength(el) for el in elems])
     di = d_all[longi_refpts[all_refs]]
     df = d_all[longf_refpts[all_refs]]
 
-    long = (length != 0.0)
     kfoc = (strength != 0.0)
     foc = long & kfoc
     nofoc = long & (~kfoc)
@@ -1056,21 +1079,20 @@ def avlinopt(ring: Lattice, dp: float = None, refpts: Refpts = None, **kwargs):
         betadrift(di.beta[~fff], df.beta[~fff], di.alpha[~fff], length[nofoc])
     avebeta[foc] = \
         betafoc(df.beta[fff], di.alpha[fff], df.alpha[fff], K2, length[foc])
-    avedisp[numpy.ix_(long, [1, 3])] = \
-        (df.dispersion[:, [0, 2]] - di.dispersion[:, [0, 2]]) / length[long]
-    idx = numpy.ix_(~fff, [0, 2])
-    avedisp[numpy.ix_(nofoc, [0, 2])] = (di.dispersion[idx] +
-                                         df.dispersion[idx]) * 0.5
-    idx = numpy.ix_(fff, [1, 3])
-    avedisp[numpy.ix_(foc, [0, 2])] = \
-        dispfoc(di.dispersion[idx], df.dispersion[idx], K2, length[foc])
+    # Positions are columns 0::2, angles are columns 1::2
+    avedisp[long, 1::2] = \
+        (df.dispersion[:, 0::2] - di.dispersion[:, 0::2]) / length[long]
+    avedisp[nofoc, 0::2] = (di.dispersion[~fff, 0::2] +
+                            df.dispersion[~fff, 0::2]) * 0.5
+    avedisp[foc, 0::2] = dispfoc(di.dispersion[fff, 1::2],
+                                 df.dispersion[fff, 1::2], K2, length[foc])
     return lindata, avebeta, avemu, avedisp, aves, bd.tune, bd.chromaticity
 
 
 @frequency_control
 def get_tune(ring: Lattice, *, method: str = 'linopt',
              dp: float = None, dct: float = None, df: float = None,
-             orbit: Orbit = None, **kwargs):
+             orbit: Orbit = None, keep_lattice: bool = False, **kwargs):
     r"""Computes the tunes using several available methods
 
     Parameters:
@@ -1087,6 +1109,8 @@ def get_tune(ring: Lattice, *, method: str = 'linopt',
         df (float):             Deviation of RF frequency.
         orbit (Orbit):          Avoids looking for the closed orbit if it is
           already known ((6,) array)
+        keep_lattice (bool):    Assume no lattice change since the
+          previous tracking. Default: :py:obj:`False`
 
     for the ``'fft'`` and ``'laskar'`` methods only:
 
@@ -1127,15 +1151,18 @@ def get_tune(ring: Lattice, *, method: str = 'linopt',
     if method == 'linopt':
         if get_integer:
             _, _, c = get_optics(ring, refpts=range(len(ring)+1),
-                                 dp=dp, dct=dct, df=df, orbit=orbit)
-            tunes = c.mu[-1]/(2*numpy.pi)
+                                 dp=dp, dct=dct, df=df, orbit=orbit,
+                                 keep_lattice=keep_lattice)
+            tunes = c.mu[-1] / _TWOPI
         else:
-            tunes = _tunes(ring, dp=dp, dct=dct, df=df, orbit=orbit)
+            tunes = _tunes(ring, dp=dp, dct=dct, df=df, orbit=orbit,
+                           keep_lattice=keep_lattice)
     else:
         nturns = kwargs.pop('nturns', 512)
         ampl = kwargs.pop('ampl', 1.0e-6)
         remove_dc = kwargs.pop('remove_dc', True)
-        ld, _, _ = linopt6(ring, dp=dp, dct=dct, df=df, orbit=orbit)
+        ld, _, _ = linopt6(ring, dp=dp, dct=dct, df=df, orbit=orbit,
+                           keep_lattice=keep_lattice)
         cents = gen_centroid(ring, ampl, nturns, remove_dc, ld)
         tunes = get_tunes_harmonic(cents, method=method, **kwargs)
     return tunes
@@ -1144,7 +1171,7 @@ def get_tune(ring: Lattice, *, method: str = 'linopt',
 @frequency_control
 def get_chrom(ring: Lattice, *, method: str = 'linopt',
               dp: float = None, dct: float = None, df: float = None,
-              cavpts: Refpts = None, **kwargs):
+              cavpts: Refpts = None, keep_lattice: bool = False, **kwargs):
     r"""Computes the chromaticities using several available methods
 
     Parameters:
@@ -1162,6 +1189,9 @@ def get_chrom(ring: Lattice, *, method: str = 'linopt',
         df (float):         Deviation of RF frequency.
         cavpts:     If :py:obj:`None`, look for ring.cavpts, or
           otherwise take all cavities.
+        keep_lattice (bool): Assume no lattice change since the
+          previous tracking. Ignored for 6D lattices, where the tunes are
+          computed on modified copies. Default: :py:obj:`False`
 
     Keyword Args:
         DPStep (float):     Momentum step for differentiation
@@ -1203,12 +1233,16 @@ def get_chrom(ring: Lattice, *, method: str = 'linopt',
         dp_step = o0up[4] - o0dn[4]
     else:
         if dct is not None or df is not None:
-            dp = find_orbit4(ring, dct=dct, df=df)[0][4]
+            dp = find_orbit4(ring, dct=dct, df=df,
+                             keep_lattice=keep_lattice)[0][4]
+            keep_lattice = True
         elif dp is None:
             dp = 0.0
-        tune_up = get_tune(ring, method=method, dp=dp + 0.5*dp_step, **kwargs)
-        tune_down = get_tune(ring, method=method,
-                             dp=dp - 0.5*dp_step, **kwargs)
+        tune_up = get_tune(ring, method=method, dp=dp + 0.5*dp_step,
+                           keep_lattice=keep_lattice, **kwargs)
+        # Both tunes use the same lattice
+        tune_down = get_tune(ring, method=method, dp=dp - 0.5*dp_step,
+                             keep_lattice=True, **kwargs)
 
     return (tune_up - tune_down) / dp_step
 
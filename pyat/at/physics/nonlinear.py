@@ -37,26 +37,19 @@ def tunes_vs_amp(ring: Lattice, amp: Optional[Sequence[float]] = None,
     """
 
     def _gen_part(ring, amp, dim, orbit, ld, nturns):
-        invx = numpy.array([[1/numpy.sqrt(ld['beta'][0]), 0],
-                            [ld['alpha'][0]/numpy.sqrt(ld['beta'][0]),
-                            numpy.sqrt(ld['beta'][0])]])
+        def _normalise(pos, ang, alpha, beta):
+            # Closed form of the 2x2 normalising matrix
+            sqb = numpy.sqrt(beta)
+            return pos / sqb - 1j * (alpha / sqb * pos + sqb * ang)
 
-        invy = numpy.array([[1/numpy.sqrt(ld['beta'][1]), 0],
-                            [ld['alpha'][1]/numpy.sqrt(ld['beta'][1]),
-                            numpy.sqrt(ld['beta'][1])]])
         part = numpy.array([orbit, ] * len(amp)).T + 1.0e-6
         part[dim, :] += amp
         part = lattice_pass(ring, part, nturns=nturns)
         sh = part.shape
-        partx = numpy.reshape(part[0, :], (sh[1], sh[3]))
-        partxp = numpy.reshape(part[1, :], (sh[1], sh[3]))
-        party = numpy.reshape(part[2, :], (sh[1], sh[3]))
-        partyp = numpy.reshape(part[3, :], (sh[1], sh[3]))
-        px = numpy.array([numpy.matmul(invx, [partx[i], partxp[i]])
-                          for i in range(len(amp))])
-        py = numpy.array([numpy.matmul(invy, [party[i], partyp[i]])
-                          for i in range(len(amp))])
-        return px[:, 0, :] - 1j*px[:, 1, :], py[:, 0, :] - 1j*py[:, 1, :]
+        part = numpy.reshape(part, (sh[0], sh[1], sh[3]))
+        alpha, beta = ld['alpha'], ld['beta']
+        return (_normalise(part[0], part[1], alpha[0], beta[0]),
+                _normalise(part[2], part[3], alpha[1], beta[1]))
 
     l0, bd, _ = linopt6(ring)
     orbit = l0['closed_orbit']
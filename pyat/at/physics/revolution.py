@@ -31,9 +31,13 @@ def get_mcf(ring: Lattice, dp: Optional[float] = 0.0,
     """
     dp_step = kwargs.pop('DPStep', DConstant.DPStep)
     fp_a, _ = find_orbit4(ring, dp=dp - 0.5*dp_step, keep_lattice=keep_lattice)
-    fp_b, _ = find_orbit4(ring, dp=dp + 0.5*dp_step, keep_lattice=True)
-    fp = numpy.stack((fp_a, fp_b),
-                     axis=0).T  # generate a Fortran contiguous array
+    # Start the second search from the first orbit
+    fp_b, _ = find_orbit4(ring, dp=dp + 0.5*dp_step, guess=fp_a,
+                          keep_lattice=True)
+    # Fill a Fortran contiguous array directly
+    fp = numpy.empty((6, 2), order='F')
+    fp[:, 0] = fp_a
+    fp[:, 1] = fp_b
     b = numpy.squeeze(lattice_pass(ring, fp, keep_lattice=True), axis=(2, 3))
     ring_length = get_s_pos(ring, len(ring))
     alphac = (b[5, 1] - b[5, 0]) / dp_step / ring_length[0]
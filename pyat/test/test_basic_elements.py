@@ -29,6 +29,29 @@ def test_base_element_methods():
     assert id(e.copy()) != id(e)
 
 
+def test_element_deepcopy():
+    r1 = numpy.arange(36.0).reshape((6, 6))
+    d = elements.Dipole('dipole', 1.0, 0.01, R1=r1)
+    c = d.deepcopy()
+    assert c.equals(d)
+    assert c.R1 is not d.R1
+    assert c.R1.flags.f_contiguous
+    assert_equal(c.R1, r1)
+    c.PolynomB[1] = 0.5
+    assert d.PolynomB[1] == 0.0
+
+
+def test_element_equals():
+    q1 = elements.Quadrupole('quad', 1.0, 0.5)
+    q2 = elements.Quadrupole('quad', 1.0, 0.5)
+    assert q1.equals(q1)
+    assert q1.equals(q2)
+    assert not q1.equals(elements.Drift('quad', 1.0))
+    # In-place modifications must be detected
+    q2.PolynomB[1] = 0.6
+    assert not q1.equals(q2)
+
+
 def test_argument_checks():
     q = elements.Quadrupole('quad', 1.0, 0.5)
     # Test type
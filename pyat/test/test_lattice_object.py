@@ -1,8 +1,9 @@
+import pickle
 import numpy
 from numpy.testing import assert_allclose, assert_equal
 import pytest
 from at import elements
-from at.lattice import Lattice, AtWarning, AtError
+from at.lattice import Lattice, Particle, AtWarning, AtError
 
 
 def test_lattice_creation_gets_attributes_from_arguments():
@@ -124,6 +125,62 @@ def test_deepcopy(hmba_lattice):
     assert id(hmba_lattice.deepcopy()[0]) != id(hmba_lattice[0])
 
 
+class _OldParticle(object):
+    """Pickles like a Particle without slots, as in older versions"""
+    def __init__(self, **state):
+        self.state = state
+
+    def __reduce__(self):
+        return object.__new__, (Particle,), self.state
+
+
+@pytest.mark.filterwarnings('ignore:AT tracking still assumes beta==1')
+@pytest.mark.parametrize('kwargs', [dict(),
+                                    dict(rest_energy=1.0e9, charge=2.0,
+                                         an_attr=12)])
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_particle_pickle(kwargs, protocol):
+    name = 'electron' if not kwargs else 'ion'
+    part = Particle(name, **kwargs)
+    newpart = pickle.loads(pickle.dumps(part, protocol=protocol))
+    assert newpart.name == part.name
+    assert newpart.rest_energy == part.rest_energy
+    assert newpart.charge == part.charge
+    assert newpart.to_dict() == part.to_dict()
+
+
+@pytest.mark.parametrize('extra', [dict(), dict(an_attr=12)])
+def test_particle_unpickle_old_layout(extra):
+    old = _OldParticle(name='ion', _rest_energy=1.0e9, _charge=2.0, **extra)
+    part = pickle.loads(pickle.dumps(old))
+    assert isinstance(part, Particle)
+    assert part.name == 'ion'
+    assert part.rest_energy == 1.0e9
+    assert part.charge == 2.0
+    assert vars(part) == extra
+    assert part.to_dict() == dict(name='ion', rest_energy=1.0e9, charge=2.0,
+                                  **extra)
+
+
+def test_lattice_pickle(hmba_lattice):
+    newring = pickle.loads(pickle.dumps(hmba_lattice))
+    assert len(newring) == len(hmba_lattice)
+    assert newring.particle.name == hmba_lattice.particle.name
+    assert newring.energy == hmba_lattice.energy
+
+
+def test_lattice_unpickle_old_layout(hmba_lattice):
+    ring = hmba_lattice.copy()
+    # Bypass the particle setter to store the old-style pickled object
+    vars(ring)['_particle'] = _OldParticle(name='relativistic',
+                                           _rest_energy=0.0, _charge=-1.0)
+    newring = pickle.loads(pickle.dumps(ring))
+    assert isinstance(newring.particle, Particle)
+    assert newring.particle.name == 'relativistic'
+    assert newring.particle.rest_energy == 0.0
+    assert newring.particle.charge == -1.0
+
+
 def test_property_values_against_known(hmba_lattice):
     assert hmba_lattice.rf_voltage == 6000000
     assert hmba_lattice.harmonic_number == 992
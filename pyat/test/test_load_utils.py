@@ -7,6 +7,7 @@ from at.lattice import Lattice, elements, params_filter, no_filter
 from at.load.utils import find_class, element_from_dict
 from at.load.utils import _CLASS_MAP, _PASS_MAP
 from at.load.utils import RingParam, split_ignoring_parentheses
+from at.load.utils import _integrator_exists
 from at.load.matfile import ringparam_filter
 
 
@@ -243,6 +244,15 @@ def test_sanitise_class_error(elem_kwargs):
         element_from_dict(elem_kwargs)
 
 
+def test_integrator_found_after_failure(tmp_path, monkeypatch):
+    # A missing integrator must be looked for again on the next call
+    monkeypatch.setattr(at.integrators, '__path__', [str(tmp_path)])
+    file_name = 'CustomTestPass.so'
+    assert not _integrator_exists(file_name)
+    (tmp_path / file_name).touch()
+    assert _integrator_exists(file_name)
+
+
 @pytest.mark.parametrize(
     "string,delimiter,target",
     [
@@ -253,6 +253,61 @@ def test_linopt_line(hmba_lattice, refpts):
     assert_close(ld['dispersion'], ltd['dispersion'], rtol=1e-7, atol=1e-12)
 
 
+def test_avlinopt(hmba_lattice):
+    # All elements: drift, quadrupole, dipole and monitor
+    _, avebeta, avemu, avedisp, aves, tune, chrom = \
+        at.avlinopt(hmba_lattice, refpts=range(len(hmba_lattice)))
+    idx = [2, 5, 13, 23]
+    assert_close(avebeta[idx], [[7.2396043695, 3.530733394],
+                                [7.4451382629, 6.212659873],
+                                [1.2981311666, 16.6775827369],
+                                [9.5504063305, 7.1761127787]], rtol=1e-8)
+    assert_close(avemu[idx], [[0.1834326206, 0.3933328017],
+                              [0.3932672958, 0.8199896704],
+                              [0.7881352981, 0.9143642126],
+                              [2.7379980385, 1.094029979]], rtol=1e-8)
+    assert_close(avedisp[idx], [[1.7268361848e-03, 4.0436855043e-09, 0, 0],
+                                [1.6566165259e-03, -6.6990335641e-04, 0, 0],
+                                [1.6814337260e-03, 5.8832700853e-03, 0, 0],
+                                [8.0373376451e-02, 4.7837876398e-02, 0, 0]],
+                 rtol=1e-6, atol=1e-12)
+    assert_close(aves[idx], [1.3257, 2.8499, 3.8930230376, 6.4792559626],
+                 rtol=1e-8)
+    assert_close(tune, [0.381562447, 0.8543754115], rtol=1e-8)
+    assert_close(chrom, [0.1791905918, 0.1224253769], rtol=1e-5)
+    # Thin elements only: the averages are the local values
+    ld, avebeta, avemu, avedisp, aves, _, _ = \
+        at.avlinopt(hmba_lattice, refpts=at.Marker)
+    assert len(ld) == 5
+    assert_close(avebeta, ld.beta, rtol=1e-15)
+    assert_close(avemu, ld.mu, rtol=1e-15)
+    assert_close(avedisp, ld.dispersion, rtol=1e-15)
+    assert_close(aves, ld.s_pos, rtol=1e-15)
+    assert_close(avebeta[1], [1.6461035405, 16.6411944507], rtol=1e-8)
+    # Single long element: focusing quadrupole
+    ld, avebeta, avemu, avedisp, aves, _, _ = \
+        at.avlinopt(hmba_lattice, refpts=5)
+    assert len(ld) == 1
+    assert_close(avebeta, [[7.4451382629, 6.212659873]], rtol=1e-8)
+    assert_close(avemu, [[0.3932672958, 0.8199896704]], rtol=1e-8)
+    assert_close(avedisp, [[1.6566165259e-03, -6.6990335641e-04, 0, 0]],
+                 rtol=1e-6, atol=1e-12)
+    assert_close(aves, [2.8499], rtol=1e-8)
+
+
+def test_analyze4_non_symplectic_raises():
+    # Uncoupled stable 1-turn matrix
+    cs, sn = numpy.cos(0.3), numpy.sin(0.3)
+    rot = numpy.array([[cs, sn], [-sn, cs]])
+    mt = numpy.zeros((4, 4))
+    mt[:2, :2] = rot
+    mt[2:, 2:] = rot
+    ms = numpy.stack((mt, mt))
+    ms[1, 2:, 2:] = numpy.diag([1.0, -1.0])
+    with pytest.raises(ValueError):
+        physics.linear._analyze4(mt, ms)
+
+
 def test_get_tune_chrom(hmba_lattice):
     qlin = hmba_lattice.get_tune()
     qplin = hmba_lattice.get_chrom()
@@ -264,6 +319,23 @@ def test_get_tune_chrom(hmba_lattice):
     assert_close(qpharm, [0.17919145, 0.12242622], rtol=1e-5)
 
 
+def test_get_tune_after_other_tracking(hmba_lattice, dba_lattice,
+                                       monkeypatch):
+    # The harmonic tunes must not rely on linopt6 tracking the ring last
+    linopt6 = physics.linear.linopt6
+
+    def linopt6_other(*args, **kwargs):
+        result = linopt6(*args, **kwargs)
+        lattice_pass(dba_lattice, numpy.zeros(6), refpts=[])
+        return result
+
+    monkeypatch.setattr(physics.linear, 'linopt6', linopt6_other)
+    qharm = hmba_lattice.get_tune(method='laskar')
+    assert_close(qharm, [0.38156245, 0.85437541], rtol=1e-8)
+    qpharm = hmba_lattice.get_chrom(method='laskar')
+    assert_close(qpharm, [0.17919145, 0.12242622], rtol=1e-5)
+
+
 def test_nl_detuning_chromaticity(hmba_lattice):
     nlqplin, _, _ = at.nonlinear.chromaticity(hmba_lattice, npoints=11)
     nlqpharm, _, _ = at.nonlinear.chromaticity(hmba_lattice,